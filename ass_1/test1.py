@@ -7,51 +7,101 @@ ITER_MAX = 200
 Q_star = 10.0      # desired queue occupancy
 gamma = 0.1        # gain factor for rate adjustment
 
+try:
+    from numba import njit
+except ImportError:
+    # numba not installed: run the simulation loops as plain Python
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+        return lambda f: f
+
+
+@njit(cache=True)
+def simulate_symmetric(N, C, ITER_MAX, Q_star, gamma, r):
+    # symmetric flows: every flow sees the same Q and starts at the same
+    # rate, so they stay equal and one scalar rate describes all of them
+    Q = 0.0  # queue occupancy in units
+    Q_history = np.empty(ITER_MAX)
+    r_history = np.empty(ITER_MAX)
+
+    for t in range(ITER_MAX):
+        # total offered load
+        total_load = N * r
+
+        # update queue
+        if total_load > C:
+            Q += (total_load - C)
+        else:
+            Q -= min(Q, C - total_load)
+
+        # store for plotting
+        Q_history[t] = Q
+        r_history[t] = r
+
+        # HPCC-inspired rate update (very simplified), never negative
+        r = max(r + gamma * (Q_star - Q), 0.0)
+
+    return Q_history, r_history
+
+
+@njit(cache=True)
+def simulate(N, C, ITER_MAX, Q_star, gamma, R0):
+    R = R0.copy()
+    Q = 0.0  # queue occupancy in units
+    Q_history = np.empty(ITER_MAX)
+    R_history = np.empty((ITER_MAX, N))
+
+    for t in range(ITER_MAX):
+        # total offered load
+        total_load = 0.0
+        for i in range(N):
+            total_load += R[i]
+
+        # update queue
+        if total_load > C:
+            Q += (total_load - C)
+        else:
+            drain = min(Q, C - total_load)
+            Q -= drain
+
+        # store for plotting
+        Q_history[t] = Q
+        R_history[t] = R
+
+        # feedback for each flow (simplified: all flows see the same Q)
+        delta = gamma * (Q_star - Q)
+        for i in range(N):
+            # HPCC-inspired rate update (very simplified), never negative
+            R[i] = max(R[i] + delta, 0.0)
+
+    return Q_history, R_history
+
+
 # initialize flow rates
 R = np.ones(N) * 20.0  # start with some guess
-Q_history = []
-R_history = []
-
-Q = 0.0  # queue occupancy in units
-
-for t in range(ITER_MAX):
-    # total offered load
-    total_load = np.sum(R)
-    
-    # update queue
-    if total_load > C:
-        Q += (total_load - C)
-    else:
-        drain = min(Q, C - total_load)
-        Q -= drain
-    
-    # store for plotting
-    Q_history.append(Q)
-    R_history.append(R.copy())
-    
-    # feedback for each flow (simplified: all flows see the same Q)
-    for i in range(N):
-        # HPCC-inspired rate update (very simplified)
-        R[i] += gamma * (Q_star - Q)
-        # ensure rates don't go negative
-        R[i] = max(R[i], 0.0)
+
+if np.allclose(R, R[0]):
+    Q_history, r_history = simulate_symmetric(N, C, ITER_MAX, Q_star, gamma, float(R[0]))
+    # every flow follows the same curve
+    R_history = np.broadcast_to(r_history[:, None], (ITER_MAX, N))
+else:
+    Q_history, R_history = simulate(N, C, ITER_MAX, Q_star, gamma, R)
 
 # plotting
-plt.figure(figsize=(10,5))
-plt.subplot(1,2,1)
-plt.plot(Q_history, label="Queue Occupancy")
-plt.axhline(Q_star, color='red', linestyle='--', label="Q* target")
-plt.legend()
-plt.title("Queue Occupancy Over Time")
-plt.xlabel("Iteration")
-plt.ylabel("Queue Size")
-
-plt.subplot(1,2,2)
-for i in range(N):
-    plt.plot([rh[i] for rh in R_history], label=f"Flow {i+1}")
-plt.title("Flow Rates Over Time")
-plt.xlabel("Iteration")
-plt.ylabel("Rate")
-plt.legend()
-plt.tight_layout()
+fig, (ax_q, ax_r) = plt.subplots(1, 2, figsize=(10,5), sharex=True)
+ax_q.plot(Q_history, label="Queue Occupancy")
+ax_q.axhline(Q_star, color='red', linestyle='--', label="Q* target")
+ax_q.legend()
+ax_q.set_title("Queue Occupancy Over Time")
+ax_q.set_xlabel("Iteration")
+ax_q.set_ylabel("Queue Size")
+
+# one line per column (flow) in a single call
+lines = ax_r.plot(R_history)
+ax_r.set_title("Flow Rates Over Time")
+ax_r.set_xlabel("Iteration")
+ax_r.set_ylabel("Rate")
+ax_r.legend(lines, [f"Flow {i+1}" for i in range(N)])
+fig.tight_layout()
 plt.show()
@@ -4,25 +4,31 @@ import argparse
 # Import the function that creates the flow
 from flow import create_tutorial_flow
 from utils.call_llm import LLMProvider_enum
+from utils.env_loader import load_env_vars
 
-# Load environment variables from .env file
-dotenv.load_dotenv()
+# Load environment variables from .env file (already parsed if utils.call_llm found the same one)
+_env_file = dotenv.find_dotenv()
+if _env_file:
+    load_env_vars(_env_file)
+
+# Provider value -> enum member lookup
+_PROVIDER_BY_VALUE = {e.value: e for e in LLMProvider_enum}
 
 # Default file patterns
-DEFAULT_INCLUDE_PATTERNS = {
+DEFAULT_INCLUDE_PATTERNS = frozenset({
     "*.py", "*.js", "*.jsx", "*.ts", "*.tsx", "*.go", "*.java", "*.pyi", "*.pyx", 
     "*.c", "*.cc", "*.cpp", "*.h", "*.md", "*.rst", "Dockerfile", 
     "Makefile", "*.yaml", "*.yml", "*.ipynb", "*.html", "*.css", "*.scss",
     "*.json", "*.txt", "*.csv", "*.xml", "*.proto", "*.sql", "*.sh",
     "*.bat", "*.ps1", "*.rb", "*.php", "*.swift", "*.kotlin", "*.dart",
     "*.pl", "*.asm", "*.asmx", "*.gohtml", "*.vue", "*.twig", "*.less", ".md"
-}
+})
 
-DEFAULT_EXCLUDE_PATTERNS = {
+DEFAULT_EXCLUDE_PATTERNS = frozenset({
     "*test*", "tests/*", "docs/*", "examples/*", "v1/*", 
     "dist/*", "build/*", "experimental/*", "deprecated/*", 
     "legacy/*", ".git/*", ".github/*", ".next/*", ".vscode/*", "obj/*", "bin/*", "node_modules/*", "*.log"
-}
+})
 
 # --- Main Fn ---
 def main():
@@ -89,12 +95,12 @@ def main():
         "github_token": github_token,
         "output_dir": args.output, # Base directory for output tut
         "model_used": args.model, # LLM provider to use as string
-        "llm_provider": LLMProvider_enum(args.model), # LLM provider enum version, usable in call_llm()
+        "llm_provider": _PROVIDER_BY_VALUE[args.model], # LLM provider enum version, usable in call_llm()
 
 
         # Add include/exclude patterns and max file size
-        "include_patterns": set(args.include) if args.include else DEFAULT_INCLUDE_PATTERNS,
-        "exclude_patterns": set(args.exclude) if args.exclude else DEFAULT_EXCLUDE_PATTERNS,
+        "include_patterns": frozenset(args.include) if args.include else DEFAULT_INCLUDE_PATTERNS,
+        "exclude_patterns": frozenset(args.exclude) if args.exclude else DEFAULT_EXCLUDE_PATTERNS,
         "max_file_size": args.max_size,
 
         # Outputs will be populated by the nodes
@@ -5,8 +5,8 @@ from utils.crawl_github_files import crawl_github_files
 from utils.call_llm import call_llm 
 from utils.crawl_local_files import crawl_local_files
 from utils.search_helpers import extract_keywords, looks_like_url
-from utils.github_api import github_search_repos, get_readme_content, RepoMetadata
-from utils.summarizer import summarize_readme
+from utils.github_api import github_search_repos, get_readmes_bulk_sync, RepoMetadata
+from utils.summarizer import summarize_readmes_bulk
 from utils.io_helpers import zip_output_folder, read_all_markdown_files
 
 # Helper to get content for specific file indices
@@ -761,14 +761,16 @@ class FilterRepos(Node):
         print(f"Searching GitHub for: {keywords} with filters: {filter_params}")
         repos = github_search_repos(keywords, filter_params, github_token)
         
-        # Get README summaries for each repository
-        for repo in repos:
-            try:
-                readme_content = get_readme_content(repo.full_name, github_token)
-                repo.readme_summary = summarize_readme(readme_content, llm_provider=llm_provider)
-            except Exception as e:
-                print(f"Error summarizing README for {repo.full_name}: {e}")
-                repo.readme_summary = "No summary available."
+        # Fetch READMEs and summarize them concurrently across repositories;
+        # a failure in either step leaves every repo without a summary rather than failing the search
+        try:
+            readmes = get_readmes_bulk_sync([repo.full_name for repo in repos], github_token)
+            summaries = summarize_readmes_bulk(readmes, llm_provider=llm_provider)
+        except Exception as e:
+            print(f"Error summarizing READMEs: {e}")
+            summaries = ["No summary available."] * len(repos)
+        for repo, summary in zip(repos, summaries):
+            repo.readme_summary = summary
         
         return repos
     
@@ -1,6 +1,7 @@
 import streamlit as st
 import os
 import time
+import hashlib
 from typing import Dict, Any, List, Optional
 from datetime import datetime
 
@@ -16,6 +17,33 @@ from nodes import SmartSearchRepo, FilterRepos, SelectRepository, RenderAndDownl
 # Load environment variables
 load_env_vars()
 
+# Provider value -> enum member, so reruns skip the Enum lookup machinery
+_PROVIDER_BY_VALUE = {e.value: e for e in LLMProvider_enum}
+
+# Default file patterns, built once per process instead of on every rerun
+DEFAULT_INCLUDE_PATTERNS = frozenset({
+    "*.py", "*.js", "*.jsx", "*.ts", "*.tsx", "*.go", "*.java", "*.pyi", "*.pyx", 
+    "*.c", "*.cc", "*.cpp", "*.h", "*.md", "*.rst", "Dockerfile", 
+    "Makefile", "*.yaml", "*.yml", "*.ipynb", "*.html", "*.css", "*.scss",
+    "*.json", "*.txt", "*.csv", "*.xml", "*.proto", "*.sql", "*.sh",
+    "*.bat", "*.ps1", "*.rb", "*.php", "*.swift", "*.kotlin", "*.dart",
+    "*.pl", "*.asm", "*.asmx", "*.gohtml", "*.vue", "*.twig", "*.less", "*.pdf"
+})
+
+DEFAULT_EXCLUDE_PATTERNS = frozenset({
+    "*test*", "tests/*", "docs/*", "examples/*", "v1/*", 
+    "dist/*", "build/*", "experimental/*", "deprecated/*", 
+    "legacy/*", ".git/*", ".github/*", ".next/*", ".vscode/*", "obj/*", "bin/*", "node_modules/*", "*.log"
+})
+
+# Shared store keys that stay the same for every search
+SHARED_STORE_DEFAULTS = {
+    "include_patterns": DEFAULT_INCLUDE_PATTERNS,
+    "exclude_patterns": DEFAULT_EXCLUDE_PATTERNS,
+    "max_file_size": 300000,
+    "output_dir": "output"
+}
+
 # 1. Page configuration (with a custom About menu item)
 st.set_page_config(
     page_title="📖🤓 LLM Codebase Finder & Documentor",
@@ -43,8 +71,9 @@ if "initialized" not in st.session_state:
         "sort_by": "stars",
         "updated_since": ""
     }
-    st.session_state.shared_store = {}
+    st.session_state.shared_store = dict(SHARED_STORE_DEFAULTS)
     st.session_state.markdown_files = {}
+    st.session_state.sorted_md_keys = []  # Chapter filenames (excluding index.md), sorted once
     st.session_state.zip_path = None
     st.session_state.task_completed = False
     st.session_state.ui_view = "search"  # Possible values: search, results, tutorial
@@ -59,6 +88,85 @@ if "initialized" not in st.session_state:
     for key, value in model_names.items():
         st.session_state[key] = value
 
+# Build the flow and search nodes once and reuse them across reruns.
+# They hold no per-run state (that lives in shared_store), so sharing is safe.
+@st.cache_resource
+def get_flow():
+    """Return the cached Streamlit UI flow."""
+    return create_streamlit_flow()
+
+@st.cache_resource
+def get_search_nodes():
+    """Return cached SmartSearchRepo and FilterRepos node instances."""
+    return SmartSearchRepo(), FilterRepos()
+
+class UncachedSearchResult(Exception):
+    """Raised by run_search() so st.cache_data does not memoize an empty/failed search."""
+    def __init__(self, result: Dict[str, Any]):
+        super().__init__("search returned no results")
+        self.result = result
+
+# Provider value -> (API key, model name) environment variables used by call_llm
+_PROVIDER_ENV_VARS = {
+    LLMProvider_enum.OPENAI.value: ("OPENAI_API_KEY", "OPENAI_MODEL"),
+    LLMProvider_enum.ANTHROPIC.value: ("ANTHROPIC_API_KEY", "ANTHROPIC_MODEL"),
+    LLMProvider_enum.GOOGLE.value: ("GEMINI_API_KEY", "GEMINI_MODEL"),
+}
+
+def llm_settings_digest(provider_value: str) -> str:
+    """Digest of the provider's API key and model name, so cached searches follow setting changes."""
+    key_var, model_var = _PROVIDER_ENV_VARS[provider_value]
+    settings = f"{os.environ.get(model_var, '')}\0{os.environ.get(key_var, '')}"
+    return hashlib.blake2b(settings.encode("utf-8"), digest_size=16).hexdigest()
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def run_search(query_input: str, filter_items: tuple, provider_value: str, github_token: str,
+               llm_settings: str) -> Dict[str, Any]:
+    """
+    Run the SmartSearchRepo and FilterRepos nodes, memoized per query.
+    
+    Args:
+        query_input (str): GitHub URL, local path, or natural language query
+        filter_items (tuple): Sorted (key, value) pairs of the filter params
+        provider_value (str): Value of the LLMProvider_enum to use
+        github_token (str): GitHub API token for authenticated requests
+        llm_settings (str): llm_settings_digest() of the provider; only part of the cache key,
+            so results computed with a missing key or another model aren't reused
+        
+    Returns:
+        Dict[str, Any]: The shared store keys written by the two nodes
+        
+    Raises:
+        UncachedSearchResult: If a natural language search found no repositories
+            (e.g. rate limiting or a network error), so a retry runs the search again
+    """
+    shared = {
+        "query_input": query_input,
+        "filter_params": dict(filter_items),
+        "github_token": github_token,
+        "llm_provider": _PROVIDER_BY_VALUE[provider_value]
+    }
+    
+    # Run nodes sequentially
+    smart_search, filter_repos = get_search_nodes()
+    smart_search.run(shared)
+    filter_repos.run(shared)
+    
+    result = {
+        key: shared[key]
+        for key in ("search_mode", "keywords", "selected_repo", "search_results")
+        if key in shared
+    }
+    if result.get("search_mode") == "nl" and not result.get("search_results"):
+        raise UncachedSearchResult(result)
+    return result
+
+def set_model_env(var: str, model_name: str) -> None:
+    """Set a *_MODEL environment variable, invalidating get_model_names() only if it changed."""
+    if os.environ.get(var) != model_name:
+        os.environ[var] = model_name
+        get_model_names.cache_clear()
+
 # --- Sidebar ---
 with st.sidebar:
     st.title("LLM Codebase Documentor")
@@ -104,46 +212,40 @@ with st.sidebar:
                 "updated_since": updated_since.isoformat() if updated_since else ""
             }
             
-            # Initialize shared store for the flow
-            st.session_state.shared_store = {
+            # Drop outputs of the previous search/run, keeping the constant defaults
+            shared_store = st.session_state.shared_store
+            for key in [k for k in shared_store if k not in SHARED_STORE_DEFAULTS]:
+                del shared_store[key]
+            
+            # Only the per-search inputs change between clicks
+            shared_store.update({
                 "query_input": query_input,
                 "filter_params": st.session_state.filter_params,
                 "github_token": st.session_state.github_token,
-                "llm_provider": LLMProvider_enum(st.session_state.provider_selection),
-                
-                # Default parameters from original flow
-                "include_patterns": {
-                    "*.py", "*.js", "*.jsx", "*.ts", "*.tsx", "*.go", "*.java", "*.pyi", "*.pyx", 
-                    "*.c", "*.cc", "*.cpp", "*.h", "*.md", "*.rst", "Dockerfile", 
-                    "Makefile", "*.yaml", "*.yml", "*.ipynb", "*.html", "*.css", "*.scss",
-                    "*.json", "*.txt", "*.csv", "*.xml", "*.proto", "*.sql", "*.sh",
-                    "*.bat", "*.ps1", "*.rb", "*.php", "*.swift", "*.kotlin", "*.dart",
-                    "*.pl", "*.asm", "*.asmx", "*.gohtml", "*.vue", "*.twig", "*.less", "*.md", "*.pdf"
-                },
-                "exclude_patterns": {
-                    "*test*", "tests/*", "docs/*", "examples/*", "v1/*", 
-                    "dist/*", "build/*", "experimental/*", "deprecated/*", 
-                    "legacy/*", ".git/*", ".github/*", ".next/*", ".vscode/*", "obj/*", "bin/*", "node_modules/*", "*.log"
-                },
-                "max_file_size": 300000,
-                "output_dir": "output"
-            }
+                "llm_provider": _PROVIDER_BY_VALUE[st.session_state.provider_selection]
+            })
             
-            # Create the flow
-            flow = create_streamlit_flow()
+            # Get the flow
+            flow = get_flow()
             
             # Run the SmartSearchRepo and FilterRepos nodes
             with st.spinner("Processing query..."):
                 # Set state to indicate we're waiting for results
                 st.session_state.ui_view = "results"
                 
-                # Run the SmartSearch and FilterRepos nodes
-                smart_search = SmartSearchRepo()
-                filter_repos = FilterRepos()
-                
-                # Run nodes sequentially
-                smart_search.run(st.session_state.shared_store)
-                filter_repos.run(st.session_state.shared_store)
+                # Run the SmartSearch and FilterRepos nodes (cached for repeat queries)
+                try:
+                    search_result = run_search(
+                        query_input,
+                        tuple(sorted(st.session_state.filter_params.items())),
+                        st.session_state.provider_selection,
+                        st.session_state.github_token,
+                        llm_settings_digest(st.session_state.provider_selection)
+                    )
+                except UncachedSearchResult as e:
+                    # Empty results are shown but not cached, so searching again retries
+                    search_result = e.result
+                st.session_state.shared_store.update(search_result)
                 
                 # Update session state with search results
                 if "search_results" in st.session_state.shared_store:
@@ -151,60 +253,71 @@ with st.sidebar:
                 
                 # If we have a selected_repo, run the full pipeline
                 if "selected_repo" in st.session_state.shared_store:
-                    st.session_state.selected_repo = st.session_state.shared_store["selected_repo"]
-                    with st.spinner("Generating tutorial..."):
-                        st.session_state.ui_view = "tutorial"
-                        # Run the full flow
-                        flow.run(st.session_state.shared_store)
-                        
-                        # Get the rendered Markdown files and ZIP path if available
-                        if "markdown_files" in st.session_state.shared_store:
-                            st.session_state.markdown_files = st.session_state.shared_store["markdown_files"]
-                        if "zip_path" in st.session_state.shared_store:
-                            st.session_state.zip_path = st.session_state.shared_store["zip_path"]
-                        
-                        st.session_state.task_completed = True
+                    repo_url = st.session_state.shared_store["selected_repo"]
+                    st.session_state.selected_repo = repo_url
+                    st.session_state.ui_view = "tutorial"
+                    
+                    # Skip the pipeline if this repository's tutorial is already generated
+                    if st.session_state.get("last_completed_repo") != repo_url:
+                        with st.spinner("Generating tutorial..."):
+                            # Drop any previous repository's output so a failed render isn't mistaken for success
+                            st.session_state.shared_store.pop("markdown_files", None)
+                            st.session_state.shared_store.pop("zip_path", None)
+                            
+                            # Run the full flow
+                            flow.run(st.session_state.shared_store)
+                            
+                            # Get the rendered Markdown files and ZIP path if available
+                            if "markdown_files" in st.session_state.shared_store:
+                                st.session_state.markdown_files = st.session_state.shared_store["markdown_files"]
+                                st.session_state.sorted_md_keys = sorted(
+                                    k for k in st.session_state.markdown_files if k != "index.md"
+                                )
+                                # Only a run that produced output counts as done; a failed render can be retried
+                                st.session_state.last_completed_repo = repo_url
+                            if "zip_path" in st.session_state.shared_store:
+                                st.session_state.zip_path = st.session_state.shared_store["zip_path"]
+                            
+                            st.session_state.task_completed = True
     
     with tab2:
         st.subheader("API Keys")
         
+        # Widgets are bound to session state via key=, so no write-back is needed
         # GitHub token
-        github_token = st.text_input(
+        st.text_input(
             "GitHub Token",
-            value=st.session_state.github_token,
+            key="github_token",
             type="password",
             help="Required for private repos or to avoid rate limits"
         )
-        st.session_state.github_token = github_token
         
         # LLM API keys
-        openai_api_key = st.text_input(
+        st.text_input(
             "OpenAI API Key",
-            value=st.session_state.openai_api_key,
+            key="openai_api_key",
             type="password"
         )
-        st.session_state.openai_api_key = openai_api_key
         
-        anthropic_api_key = st.text_input(
+        st.text_input(
             "Anthropic API Key",
-            value=st.session_state.anthropic_api_key,
+            key="anthropic_api_key",
             type="password"
         )
-        st.session_state.anthropic_api_key = anthropic_api_key
         
-        gemini_api_key = st.text_input(
+        st.text_input(
             "Google Gemini API Key",
-            value=st.session_state.gemini_api_key,
+            key="gemini_api_key",
             type="password"
         )
-        st.session_state.gemini_api_key = gemini_api_key
         
         # Save API keys to environment
         if st.button("Save API Keys"):
-            os.environ["GITHUB_TOKEN"] = github_token
-            os.environ["OPENAI_API_KEY"] = openai_api_key
-            os.environ["ANTHROPIC_API_KEY"] = anthropic_api_key
-            os.environ["GEMINI_API_KEY"] = gemini_api_key
+            os.environ["GITHUB_TOKEN"] = st.session_state["github_token"]
+            os.environ["OPENAI_API_KEY"] = st.session_state["openai_api_key"]
+            os.environ["ANTHROPIC_API_KEY"] = st.session_state["anthropic_api_key"]
+            os.environ["GEMINI_API_KEY"] = st.session_state["gemini_api_key"]
+            get_api_keys.cache_clear()
             st.success("API keys saved to environment!")
     
     with tab3:
@@ -225,7 +338,7 @@ with st.sidebar:
                 value=st.session_state.openai_model
             )
             st.session_state.openai_model = model_name
-            os.environ["OPENAI_MODEL"] = model_name
+            set_model_env("OPENAI_MODEL", model_name)
         
         elif provider_selection == LLMProvider_enum.ANTHROPIC.value:
             model_name = st.text_input(
@@ -233,7 +346,7 @@ with st.sidebar:
                 value=st.session_state.anthropic_model
             )
             st.session_state.anthropic_model = model_name
-            os.environ["ANTHROPIC_MODEL"] = model_name
+            set_model_env("ANTHROPIC_MODEL", model_name)
         
         else:  # Gemini
             model_name = st.text_input(
@@ -241,34 +354,44 @@ with st.sidebar:
                 value=st.session_state.gemini_model
             )
             st.session_state.gemini_model = model_name
-            os.environ["GEMINI_MODEL"] = model_name
+            set_model_env("GEMINI_MODEL", model_name)
             
         # Add save button for model settings
         if st.button("Save Model Settings"):
             # Save provider selection to session state
             st.session_state.provider_selection = provider_selection
-            st.session_state.shared_store["llm_provider"] = LLMProvider_enum(provider_selection)
+            st.session_state.shared_store["llm_provider"] = _PROVIDER_BY_VALUE[provider_selection]
             
             # Save model name based on provider
             if provider_selection == LLMProvider_enum.OPENAI.value:
-                os.environ["OPENAI_MODEL"] = model_name
+                set_model_env("OPENAI_MODEL", model_name)
                 st.session_state.openai_model = model_name
             elif provider_selection == LLMProvider_enum.ANTHROPIC.value:
-                os.environ["ANTHROPIC_MODEL"] = model_name
+                set_model_env("ANTHROPIC_MODEL", model_name)
                 st.session_state.anthropic_model = model_name
             else:  # Gemini
-                os.environ["GEMINI_MODEL"] = model_name
+                set_model_env("GEMINI_MODEL", model_name)
                 st.session_state.gemini_model = model_name
                 
             st.success(f"Model settings saved! Provider: {provider_selection}, Model: {model_name}")
 
 # --- Main Content ---
+GITHUB_FAVICON_URL = "https://github.githubassets.com/favicons/favicon.png"
+
+# cache_resource hands out the same (immutable) bytes instead of an unpickled copy per
+# rerun, and max_entries=1 keeps only the latest tutorial ZIP in memory
+@st.cache_resource(max_entries=1, show_spinner=False)
+def load_zip(path: str, mtime: float) -> bytes:
+    """Read the tutorial ZIP once; mtime is part of the cache key so a regenerated file is re-read."""
+    with open(path, "rb") as f:
+        return f.read()
+
 def display_repo_card(repo: RepoMetadata, index: int):
     """Display a repository card with details and select button."""
     col1, col2 = st.columns([1, 4])
     
     with col1:
-        st.image("https://github.githubassets.com/favicons/favicon.png", width=50)
+        st.image(GITHUB_FAVICON_URL, width=50)
         st.button(f"Select", key=f"select_{index}", on_click=select_repository, args=(repo.url,))
     
     with col2:
@@ -281,56 +404,43 @@ def select_repository(repo_url: str):
     """Handle repository selection from search results."""
     st.session_state.selected_repo = repo_url
     
-    # Make sure we have the shared store initialized
-    if not st.session_state.shared_store:
-        st.session_state.shared_store = {}
+    shared_store = st.session_state.shared_store
     
     # Set the selected repository URL in the shared store
-    st.session_state.shared_store["selected_repo"] = repo_url
-    st.session_state.shared_store["repo_url"] = repo_url
-    st.session_state.shared_store["local_dir"] = None
+    shared_store["selected_repo"] = repo_url
+    shared_store["repo_url"] = repo_url
+    shared_store["local_dir"] = None
     
     # Make sure we have other necessary parameters in the shared store
-    if "include_patterns" not in st.session_state.shared_store:
-        st.session_state.shared_store["include_patterns"] = {
-            "*.py", "*.js", "*.jsx", "*.ts", "*.tsx", "*.go", "*.java", "*.pyi", "*.pyx", 
-            "*.c", "*.cc", "*.cpp", "*.h", "*.md", "*.rst", "Dockerfile", 
-            "Makefile", "*.yaml", "*.yml", "*.ipynb", "*.html", "*.css", "*.scss",
-            "*.json", "*.txt", "*.csv", "*.xml", "*.proto", "*.sql", "*.sh",
-            "*.bat", "*.ps1", "*.rb", "*.php", "*.swift", "*.kotlin", "*.dart",
-            "*.pl", "*.asm", "*.asmx", "*.gohtml", "*.vue", "*.twig", "*.less", ".md"
-        }
-    
-    if "exclude_patterns" not in st.session_state.shared_store:
-        st.session_state.shared_store["exclude_patterns"] = {
-            "*test*", "tests/*", "docs/*", "examples/*", "v1/*", 
-            "dist/*", "build/*", "experimental/*", "deprecated/*", 
-            "legacy/*", ".git/*", ".github/*", ".next/*", ".vscode/*", "obj/*", "bin/*", "node_modules/*", "*.log"
-        }
-        
-    if "max_file_size" not in st.session_state.shared_store:
-        st.session_state.shared_store["max_file_size"] = 300000
-        
-    if "output_dir" not in st.session_state.shared_store:
-        st.session_state.shared_store["output_dir"] = "output"
-        
-    if "github_token" not in st.session_state.shared_store:
-        st.session_state.shared_store["github_token"] = st.session_state.github_token
-        
-    if "llm_provider" not in st.session_state.shared_store:
-        st.session_state.shared_store["llm_provider"] = LLMProvider_enum(st.session_state.provider_selection)
+    for key, value in SHARED_STORE_DEFAULTS.items():
+        shared_store.setdefault(key, value)
+    shared_store.setdefault("github_token", st.session_state.github_token)
+    shared_store.setdefault("llm_provider", _PROVIDER_BY_VALUE[st.session_state.provider_selection])
     
     st.session_state.ui_view = "tutorial"
     
-    # Create and run the flow
-    flow = create_streamlit_flow()
+    # Skip the pipeline if this repository's tutorial is already generated
+    if st.session_state.get("last_completed_repo") == repo_url:
+        return
+    
+    # Get and run the flow
+    flow = get_flow()
     with st.spinner("Generating tutorial..."):
+        # Drop any previous repository's output so a failed render isn't mistaken for success
+        st.session_state.shared_store.pop("markdown_files", None)
+        st.session_state.shared_store.pop("zip_path", None)
+        
         # Run the full flow
         flow.run(st.session_state.shared_store)
         
         # Get the rendered Markdown files and ZIP path if available
         if "markdown_files" in st.session_state.shared_store:
             st.session_state.markdown_files = st.session_state.shared_store["markdown_files"]
+            st.session_state.sorted_md_keys = sorted(
+                k for k in st.session_state.markdown_files if k != "index.md"
+            )
+            # Only a run that produced output counts as done; a failed render can be retried
+            st.session_state.last_completed_repo = repo_url
         if "zip_path" in st.session_state.shared_store:
             st.session_state.zip_path = st.session_state.shared_store["zip_path"]
         
@@ -385,13 +495,12 @@ elif st.session_state.ui_view == "tutorial":
     
     # Download button for ZIP if available
     if st.session_state.zip_path:
-        with open(st.session_state.zip_path, "rb") as f:
-            st.download_button(
-                label="Download Tutorial ZIP",
-                data=f,
-                file_name=f"{project_name}_tutorial.zip",
-                mime="application/zip"
-            )
+        st.download_button(
+            label="Download Tutorial ZIP",
+            data=load_zip(st.session_state.zip_path, os.path.getmtime(st.session_state.zip_path)),
+            file_name=f"{project_name}_tutorial.zip",
+            mime="application/zip"
+        )
     
     # Display the Markdown files
     if st.session_state.markdown_files:
@@ -401,7 +510,7 @@ elif st.session_state.ui_view == "tutorial":
             st.markdown("---")
         
         # Then show all other files in order
-        for filename in sorted([f for f in st.session_state.markdown_files if f != "index.md"]):
+        for filename in st.session_state.sorted_md_keys:
             with st.expander(f"{filename}", expanded=True):
                 st.markdown(st.session_state.markdown_files[filename])
     else:
@@ -416,6 +525,12 @@ st.markdown(
     "[Cloud Assignment 2 – GitHub LLM Codebase Knowledge Building Summarizer](https://github.com/tej172/cloud_indv_assignments/tree/main/ass_2)"
 )
 
-# Create .env.example file if it doesn't exist
-if not os.path.exists(".env.example"):
-    create_env_example() 
\ No newline at end of file
+# Create .env.example file if it doesn't exist (checked once per process)
+@st.cache_resource
+def ensure_env_example() -> bool:
+    """Create the .env.example file if it is missing."""
+    if not os.path.exists(".env.example"):
+        create_env_example()
+    return True
+
+ensure_env_example()
\ No newline at end of file
@@ -0,0 +1,87 @@
+import asyncio
+import threading
+import time
+from typing import Any, Awaitable, Callable, List, Optional
+
+# One long-lived event loop, on a daemon thread, shared by every run_sync() call
+_LOOP: Optional[asyncio.AbstractEventLoop] = None
+_LOOP_LOCK = threading.Lock()
+
+def _background_loop() -> asyncio.AbstractEventLoop:
+    """Start the shared event loop on first use and return it."""
+    global _LOOP
+    with _LOOP_LOCK:
+        if _LOOP is None:
+            _LOOP = asyncio.new_event_loop()
+            threading.Thread(target=_LOOP.run_forever, name="async-helpers-loop", daemon=True).start()
+        return _LOOP
+
+def run_sync(coro: Awaitable[Any]) -> Any:
+    """
+    Run a coroutine from synchronous code and wait for its result.
+    
+    Unlike asyncio.run(), every call shares one event loop, so async clients cached per
+    loop (see utils.call_llm) are reused across calls instead of being rebuilt and
+    leaked; it also works when the calling thread already runs an event loop.
+    """
+    return asyncio.run_coroutine_threadsafe(coro, _background_loop()).result()
+
+class AsyncRateLimiter:
+    """Token bucket allowing at most `rate` acquisitions per `period` seconds."""
+
+    def __init__(self, rate: int, period: float = 60.0):
+        self.rate = rate
+        self.period = period
+        self._tokens = float(rate)
+        self._last = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """Wait until a token is available, then take it."""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.rate, self._tokens + (now - self._last) * self.rate / self.period)
+                self._last = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) * self.period / self.rate)
+
+async def gather_bounded(
+    items: List[Any],
+    worker: Callable[[Any], Awaitable[Any]],
+    max_concurrency: int = 8,
+    rate_limit_per_min: Optional[int] = None,
+    on_progress: Optional[Callable[[int, int], None]] = None
+) -> List[Any]:
+    """
+    Run worker(item) for every item concurrently, with bounded concurrency and rate.
+
+    Args:
+        items (list): Inputs to process
+        worker (callable): Async function called once per item
+        max_concurrency (int): Maximum number of workers in flight at once
+        rate_limit_per_min (int, optional): Maximum number of worker starts per minute
+        on_progress (callable, optional): Called as on_progress(completed, total) after each item
+
+    Returns:
+        list: Results in the same order as items
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+    limiter = AsyncRateLimiter(rate_limit_per_min) if rate_limit_per_min else None
+    total = len(items)
+    completed = 0
+
+    async def run_one(item):
+        nonlocal completed
+        async with semaphore:
+            if limiter:
+                await limiter.acquire()
+            result = await worker(item)
+        completed += 1
+        if on_progress:
+            on_progress(completed, total)
+        return result
+
+    return await asyncio.gather(*(run_one(item) for item in items))
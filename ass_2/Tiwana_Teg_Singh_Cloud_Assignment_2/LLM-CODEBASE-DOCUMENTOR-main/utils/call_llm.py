@@ -1,15 +1,24 @@
-from google import genai
-from anthropic import Anthropic
-from openai import OpenAI
-from dotenv import load_dotenv
+from dotenv import find_dotenv
 import os
+import asyncio
 import logging
+import logging.handlers
 import json
+import time
+import hashlib
+import threading
+from collections import OrderedDict
+from contextlib import closing, aclosing
 from datetime import datetime
 from enum import Enum
+from typing import AsyncIterator, Iterator, Optional
+from utils.env_loader import load_env_vars
 
 # Load environment variables from .env file
-load_dotenv()  # Loads from .env file
+# find_dotenv() searches upward from this file, as load_dotenv() did
+_env_file = find_dotenv()
+if _env_file:
+    load_env_vars(_env_file)
 
 class LLMProvider_enum(str, Enum):
     ANTHROPIC = 'anthropic-claude'
@@ -27,111 +36,629 @@ logger.setLevel(logging.INFO)
 logger.propagate = False  # Prevent propagation to root logger
 file_handler = logging.FileHandler(log_file, encoding="utf-8")
 file_handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
-logger.addHandler(file_handler)
+# Buffer records in memory and write them in batches (immediately on errors, and at exit)
+logger.addHandler(logging.handlers.MemoryHandler(
+    capacity=1000, flushLevel=logging.ERROR, target=file_handler
+))
 
-# Simple cache configuration
-cache_file = "llm_cache.json"
+# Simple cache configuration: an append-only JSONL file (compacted on load), loaded once into an
+# in-memory LRU capped at cache_max_entries (env: LLM_CACHE_ENABLED, LLM_CACHE_MAX_ENTRIES)
+cache_file = os.getenv("LLM_CACHE_FILE", "llm_cache.jsonl")
+legacy_cache_file = "llm_cache.json"  # Old single-JSON-object format, migrated on first run
+cache_enabled = os.getenv("LLM_CACHE_ENABLED", "1") != "0"
+cache_max_entries = int(os.getenv("LLM_CACHE_MAX_ENTRIES", "1000"))
+# Rewrite the file with only the surviving entries once it has this many lines per entry kept
+CACHE_COMPACT_FACTOR = 2
+_CACHE: "OrderedDict[str, str]" = OrderedDict()
+_CACHE_LOCK = threading.Lock()
+
+def _model_name(model: str) -> str:
+    """Return the concrete model name configured for an LLM provider."""
+    if model == LLMProvider_enum.GOOGLE:
+        return os.getenv("GEMINI_MODEL", "gemini-2.5-pro-exp-03-25")
+    elif model == LLMProvider_enum.ANTHROPIC:
+        return os.environ.get("ANTHROPIC_MODEL", "claude-3-7-sonnet-20250219")
+    else: # Assume OpenAI
+        return os.environ.get("OPENAI_MODEL", "o4-mini")
+
+def _cache_key(prompt: str, model_name: str) -> str:
+    """Return a short digest of (model_name, prompt) to use as the cache key."""
+    return hashlib.blake2b(f"{model_name}\0{prompt}".encode("utf-8"), digest_size=16).hexdigest()
+
+def _evict() -> None:
+    """Drop least recently used entries until the cache fits cache_max_entries."""
+    while len(_CACHE) > cache_max_entries:
+        _CACHE.popitem(last=False)
+
+def _migrate_legacy_cache() -> None:
+    """Convert the legacy JSON cache to JSONL the first time the JSONL cache is missing."""
+    if not os.path.exists(cache_file) and os.path.exists(legacy_cache_file):
+        try:
+            with open(legacy_cache_file, 'r') as f:
+                legacy_cache = json.load(f)
+            tmp_file = cache_file + ".tmp"
+            with open(tmp_file, 'w') as f:
+                # Legacy entries were keyed on the prompt alone; file them under
+                # the default provider's model, which is what call_llm() used by default
+                default_model_name = _model_name(LLMProvider_enum.GOOGLE)
+                for prompt, value in legacy_cache.items():
+                    key = _cache_key(prompt, default_model_name)
+                    f.write(json.dumps({"k": key, "v": value}) + "\n")
+            os.replace(tmp_file, cache_file)
+            logger.warning(f"Migrated {len(legacy_cache)} entries from {legacy_cache_file} to {cache_file}")
+        except Exception as e:
+            logger.warning(f"Failed to migrate legacy cache: {e}")
+
+def _load_cache() -> None:
+    """Load the on-disk cache into memory."""
+    if not os.path.exists(cache_file):
+        return
+    line_count = 0
+    try:
+        with open(cache_file, 'r') as f:
+            for line in f:
+                line_count += 1
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    # Skip a partially written line (e.g. process killed mid-append)
+                    continue
+                # Later lines are newer, so they end up as the most recently used
+                _CACHE[entry["k"]] = entry["v"]
+                _CACHE.move_to_end(entry["k"])
+                _evict()
+        logger.warning(f"Loaded {len(_CACHE)} cache entries")
+    except Exception as e:
+        logger.warning(f"Failed to load cache, starting with empty cache: {e}")
+        return
+    
+    # Evicted and re-saved keys keep appending lines; drop the dead ones so the
+    # file (and this startup parse) stays bounded
+    if line_count > CACHE_COMPACT_FACTOR * max(cache_max_entries, 1):
+        _compact_cache_file(line_count)
+
+def _compact_cache_file(line_count: int) -> None:
+    """Rewrite the on-disk cache with only the entries currently in memory, oldest first."""
+    try:
+        tmp_file = cache_file + ".tmp"
+        with open(tmp_file, 'w') as f:
+            for key, value in _CACHE.items():
+                f.write(json.dumps({"k": key, "v": value}) + "\n")
+        os.replace(tmp_file, cache_file)
+        logger.warning(f"Compacted {cache_file} from {line_count} to {len(_CACHE)} lines")
+    except Exception as e:
+        logger.warning(f"Failed to compact cache file: {e}")
+
+def _get_from_cache(key: str):
+    """Return the cached response for key (marking it recently used), or None."""
+    with _CACHE_LOCK:
+        value = _CACHE.get(key)
+        if value is not None:
+            _CACHE.move_to_end(key)
+        return value
+
+def _save_to_cache(key: str, value: str) -> None:
+    """Store a response in memory and append it to the on-disk cache."""
+    with _CACHE_LOCK:
+        _CACHE[key] = value
+        _CACHE.move_to_end(key)
+        _evict()
+        try:
+            with open(cache_file, 'a') as f:
+                f.write(json.dumps({"k": key, "v": value}) + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+        except Exception as e:
+            logger.error(f"Failed to save cache: {e}")
+
+def configure_cache(enable: bool = None, max_entries: int = None, disk_path: str = None) -> None:
+    """
+    Change the LLM cache settings at runtime.
+    
+    Args:
+        enable (bool, optional): Turn the cache on or off for all calls
+        max_entries (int, optional): Maximum number of responses kept in memory
+        disk_path (str, optional): JSONL file to persist to; the cache is reloaded from it
+    """
+    global cache_enabled, cache_max_entries, cache_file
+    with _CACHE_LOCK:
+        if enable is not None:
+            cache_enabled = enable
+        if max_entries is not None:
+            cache_max_entries = max_entries
+            _evict()
+        if disk_path is not None and disk_path != cache_file:
+            cache_file = disk_path
+            _CACHE.clear()
+            _load_cache()
+
+_migrate_legacy_cache()
+_load_cache()
+
+# Provider clients are created on first use and reused, so each call doesn't
+# rebuild the HTTP connection pool. A client is rebuilt only if its API key changes
+# (e.g. keys saved from the Streamlit sidebar).
+# The provider SDKs are heavy, so each one is imported inside its factory on first use.
+_CLIENTS: dict = {}  # provider -> (api_key, client)
+_CLIENT_LOCK = threading.Lock()
+
+def _cached_client(provider: LLMProvider_enum, api_key: str, factory):
+    """Return the shared client for provider, creating it with factory() if needed."""
+    with _CLIENT_LOCK:
+        entry = _CLIENTS.get(provider)
+        if entry is None or entry[0] != api_key:
+            entry = (api_key, factory())
+            _CLIENTS[provider] = entry
+        return entry[1]
+
+def _get_gemini_client():
+    # client = genai.Client(
+    #     vertexai=True, 
+    #     # TODO: change to your own project id and location
+    #     project=os.getenv("GEMINI_PROJECT_ID", "llm-code-explainer"),
+    #     location=os.getenv("GEMINI_LOCATION", "us-central1")
+    # )
+    api_key = os.getenv("GEMINI_API_KEY")
+    def factory():
+        from google import genai
+        return genai.Client(api_key=api_key)
+    return _cached_client(LLMProvider_enum.GOOGLE, api_key, factory)
+
+def _get_anthropic_client():
+    api_key = os.environ.get("ANTHROPIC_API_KEY")
+    def factory():
+        from anthropic import Anthropic
+        return Anthropic(api_key=api_key)
+    return _cached_client(LLMProvider_enum.ANTHROPIC, api_key, factory)
+
+def _get_openai_client():
+    api_key = os.environ.get("OPENAI_API_KEY")
+    def factory():
+        from openai import OpenAI
+        return OpenAI(api_key=api_key)
+    return _cached_client(LLMProvider_enum.OPENAI, api_key, factory)
+
+def _call_gemini(client, prompt: str, model_name: str) -> str:
+    # Use Google Gemini
+    response = client.models.generate_content(
+        model=model_name,
+        contents=[prompt]
+    )
+    return response.text
+
+def _anthropic_params(prompt: str, model_name: str) -> dict:
+    """Request parameters for Anthropic Claude, shared by the sync, async and batch calls."""
+    # Use Anthropic Claude 3.7 Sonnet Extended Thinking
+    return dict(
+        model=model_name,
+        max_tokens=15000, #If have extra api budget, can increase this to 21000
+        thinking={
+            "type": "enabled", 
+            "budget_tokens": 10000 # If have extra api budget, can increase this to 20000
+        },
+        messages=[
+            {"role": "user", "content": prompt}
+        ]
+    )
+
+def _openai_params(prompt: str, model_name: str) -> dict:
+    """Request parameters for OpenAI, shared by the sync, async and batch calls."""
+    # Use the default LLM, which is OpenAI (Use OpenAI o1/4o/gpt-4o-mini) depedning on the model & api budget
+    return dict(
+        model=model_name,
+        messages=[{"role": "user", "content": prompt}],
+        response_format={
+            "type": "text"
+        },
+        reasoning_effort="medium",
+        store=False
+    )
+
+def _call_anthropic(client, prompt: str, model_name: str) -> str:
+    response = client.messages.create(**_anthropic_params(prompt, model_name))
+    return response.content[1].text
+
+def _call_openai(client, prompt: str, model_name: str) -> str:
+    response = client.chat.completions.create(**_openai_params(prompt, model_name))
+    return response.choices[0].message.content
 
 # By default, we Google Gemini 2.5 pro gievn recent high bench marks
 def call_llm(prompt: str, use_cache: bool = True, model: str=LLMProvider_enum.GOOGLE) -> str:
-    print(f"Calling LLM with model: {model}")
+    logger.debug("Calling LLM with model: %s", model)
     
     # Log the prompt
-    logger.info(f"PROMPT: {prompt}")
+    logger.info("PROMPT: %s", prompt)
     
-    # Check cache if enabled
+    # Check cache if enabled (keyed on the model too, so providers don't share answers)
+    model_name = _model_name(model)
+    cache_key = _cache_key(prompt, model_name)
+    use_cache = use_cache and cache_enabled
     if use_cache:
-        # Load cache from disk
-        cache = {}
-        if os.path.exists(cache_file):
-            try:
-                with open(cache_file, 'r') as f:
-                    cache = json.load(f)
-                logger.warning(f"Loaded and Using cache")
-            except:
-                logger.warning(f"Failed to load cache, starting with empty cache")
-        
-        # Return from cache if exists
-        if prompt in cache:
-            logger.info(f"RESPONSE: {cache[prompt]}")
-            return cache[prompt]
+        # Return from the in-memory cache if exists
+        cached = _get_from_cache(cache_key)
+        if cached is not None:
+            logger.info("RESPONSE: %s", cached)
+            return cached
         
 
     # If not in cache, call the LLM
     # Call the LLM if not in cache or cache disabled
     if(model==LLMProvider_enum.GOOGLE):
-        # Use Google Gemini
-        
-        # client = genai.Client(
-        #     vertexai=True, 
-        #     # TODO: change to your own project id and location
-        #     project=os.getenv("GEMINI_PROJECT_ID", "llm-code-explainer"),
-        #     location=os.getenv("GEMINI_LOCATION", "us-central1")
-        # )
-        # 
-        client = genai.Client(
-            api_key=os.getenv("GEMINI_API_KEY"),
-        )
-        model = os.getenv("GEMINI_MODEL", "gemini-2.5-pro-exp-03-25")
-        response = client.models.generate_content(
-            model=model,
-            contents=[prompt]
-        )
-        response_text = response.text
+        response_text = _call_gemini(_get_gemini_client(), prompt, model_name)
     elif(model==LLMProvider_enum.ANTHROPIC):
-        # Use Anthropic Claude
-        client = Anthropic(api_key=os.environ.get("ANTHROPIC_API_KEY"))
-        response = client.messages.create(
-            # Use Anthropic Claude 3.7 Sonnet Extended Thinking
-            model=os.environ.get("ANTHROPIC_MODEL", "claude-3-7-sonnet-20250219"), 
-            max_tokens=15000, #If have extra api budget, can increase this to 21000
-            thinking={
-                "type": "enabled", 
-                "budget_tokens": 10000 # If have extra api budget, can increase this to 20000
-            },
-            messages=[
-                {"role": "user", "content": prompt}
-            ]
-        )
-        response_text = response.content[1].text
+        response_text = _call_anthropic(_get_anthropic_client(), prompt, model_name)
     else: # Assume OpenAI
-        # Use the default LLM, which is OpenAI (Use OpenAI o1/4o/gpt-4o-mini) depedning on the model & api budget
-        client = OpenAI(api_key=os.environ.get("OPENAI_API_KEY"))
-        response = client.chat.completions.create(
-            model=os.environ.get("OPENAI_MODEL", "o4-mini"),
-            messages=[{"role": "user", "content": prompt}],
-            response_format={
-                "type": "text"
-            },
-            reasoning_effort="medium",
-            store=False
-        )
-        response_text = response.choices[0].message.content
+        response_text = _call_openai(_get_openai_client(), prompt, model_name)
 
     # Log the response
-    logger.info(f"RESPONSE: {response_text}")
+    logger.info("RESPONSE: %s", response_text)
     
     # Update cache if enabled
     if use_cache:
-        # Load cache again to avoid overwrites
-        cache = {}
-        if os.path.exists(cache_file):
-            try:
-                with open(cache_file, 'r') as f:
-                    cache = json.load(f)
-            except:
-                pass
+        # Add to cache and append to disk
+        _save_to_cache(cache_key, response_text)
+    
+    return response_text
+
+def _stream_cache_keys(prompt: str, model_name: str, max_chars: Optional[int]):
+    """Cache keys for a full streamed response and for one cut short at max_chars."""
+    partial_key = _cache_key(prompt, f"{model_name}\0max_chars={max_chars}") if max_chars is not None else None
+    return _cache_key(prompt, model_name), partial_key
+
+def _get_stream_from_cache(cache_key: str, partial_key: Optional[str]):
+    """Return the cached full response, else the cut-short one, or None."""
+    cached = _get_from_cache(cache_key)
+    if cached is None and partial_key is not None:
+        cached = _get_from_cache(partial_key)
+    return cached
+
+def _stream_gemini(client, prompt: str, model_name: str) -> Iterator[str]:
+    for chunk in client.models.generate_content_stream(
+        model=model_name,
+        contents=[prompt]
+    ):
+        if chunk.text:
+            yield chunk.text
+
+def _stream_anthropic(client, prompt: str, model_name: str) -> Iterator[str]:
+    # text_stream only yields the answer text, not the thinking blocks
+    with client.messages.stream(**_anthropic_params(prompt, model_name)) as stream:
+        yield from stream.text_stream
+
+def _stream_openai(client, prompt: str, model_name: str) -> Iterator[str]:
+    with client.chat.completions.create(**_openai_params(prompt, model_name), stream=True) as stream:
+        for chunk in stream:
+            if chunk.choices and chunk.choices[0].delta.content:
+                yield chunk.choices[0].delta.content
+
+def call_llm_stream(prompt: str, use_cache: bool = True, model: str=LLMProvider_enum.GOOGLE,
+                    max_chars: Optional[int] = None) -> Iterator[str]:
+    """
+    Streaming version of call_llm(): yields the response text as it arrives.
+    
+    With max_chars set, the stream is closed once more than max_chars characters have
+    arrived. Such a cut-short response is cached under its own key (prompt, model and
+    max_chars), so call_llm() never gets a truncated answer back from the cache.
+    
+    Args:
+        prompt (str): Prompt to send
+        use_cache (bool): Whether to read from and write to the response cache
+        model: LLM provider to use
+        max_chars (int, optional): Stop reading once more than this many characters arrived
         
-        # Add to cache and save
-        cache[prompt] = response_text
-        try:
-            with open(cache_file, 'w') as f:
-                json.dump(cache, f)
-        except Exception as e:
-            logger.error(f"Failed to save cache: {e}")
+    Yields:
+        str: Chunks of the response text (a cache hit is yielded as one chunk)
+    """
+    logger.debug("Calling LLM (stream) with model: %s", model)
+    logger.info("PROMPT: %s", prompt)
+    
+    model_name = _model_name(model)
+    cache_key, partial_key = _stream_cache_keys(prompt, model_name, max_chars)
+    use_cache = use_cache and cache_enabled
+    if use_cache:
+        cached = _get_stream_from_cache(cache_key, partial_key)
+        if cached is not None:
+            logger.info("RESPONSE: %s", cached)
+            yield cached
+            return
+    
+    if(model==LLMProvider_enum.GOOGLE):
+        chunks = _stream_gemini(_get_gemini_client(), prompt, model_name)
+    elif(model==LLMProvider_enum.ANTHROPIC):
+        chunks = _stream_anthropic(_get_anthropic_client(), prompt, model_name)
+    else: # Assume OpenAI
+        chunks = _stream_openai(_get_openai_client(), prompt, model_name)
+    
+    parts = []
+    length = 0
+    complete = True
+    with closing(chunks):
+        for chunk in chunks:
+            parts.append(chunk)
+            length += len(chunk)
+            yield chunk
+            if max_chars is not None and length > max_chars:
+                complete = False
+                break
+    
+    # Not reached if the caller closes the generator early; nothing is cached then
+    response_text = "".join(parts)
+    logger.info("RESPONSE: %s", response_text)
+    if use_cache:
+        _save_to_cache(cache_key if complete else partial_key, response_text)
+
+# Async clients are tied to the event loop they were created on, so they are cached
+# per provider and rebuilt when the API key or the running loop changes. The bulk
+# helpers all run on the shared loop from utils.async_helpers.run_sync(), so in
+# practice each client is built once and reused across searches.
+_ASYNC_CLIENTS: dict = {}  # provider -> (api_key, loop, client)
+
+async def _aclose_client(client) -> None:
+    """Close a replaced async client's connection pool."""
+    close = getattr(client, "aclose", None) or getattr(client, "close", None)
+    try:
+        if close is not None:
+            result = close()
+            if asyncio.iscoroutine(result):
+                await result
+    except Exception as e:
+        logger.warning(f"Failed to close async LLM client: {e}")
+
+def _cached_async_client(provider: LLMProvider_enum, api_key: str, factory):
+    """Return the shared async client for provider on the running event loop."""
+    loop = asyncio.get_running_loop()
+    with _CLIENT_LOCK:
+        entry = _ASYNC_CLIENTS.get(provider)
+        if entry is None or entry[0] != api_key or entry[1] is not loop:
+            # A client from this loop (API key changed) can still be closed cleanly;
+            # one from another loop can't be awaited here
+            if entry is not None and entry[1] is loop:
+                loop.create_task(_aclose_client(entry[2]))
+            entry = (api_key, loop, factory())
+            _ASYNC_CLIENTS[provider] = entry
+        return entry[2]
+
+def _get_async_gemini_client():
+    api_key = os.getenv("GEMINI_API_KEY")
+    def factory():
+        from google import genai
+        return genai.Client(api_key=api_key).aio
+    return _cached_async_client(LLMProvider_enum.GOOGLE, api_key, factory)
+
+def _get_async_anthropic_client():
+    api_key = os.environ.get("ANTHROPIC_API_KEY")
+    def factory():
+        from anthropic import AsyncAnthropic
+        return AsyncAnthropic(api_key=api_key)
+    return _cached_async_client(LLMProvider_enum.ANTHROPIC, api_key, factory)
+
+def _get_async_openai_client():
+    api_key = os.environ.get("OPENAI_API_KEY")
+    def factory():
+        from openai import AsyncOpenAI
+        return AsyncOpenAI(api_key=api_key)
+    return _cached_async_client(LLMProvider_enum.OPENAI, api_key, factory)
+
+async def _acall_gemini(client, prompt: str, model_name: str) -> str:
+    response = await client.models.generate_content(
+        model=model_name,
+        contents=[prompt]
+    )
+    return response.text
+
+async def _acall_anthropic(client, prompt: str, model_name: str) -> str:
+    response = await client.messages.create(**_anthropic_params(prompt, model_name))
+    return response.content[1].text
+
+async def _acall_openai(client, prompt: str, model_name: str) -> str:
+    response = await client.chat.completions.create(**_openai_params(prompt, model_name))
+    return response.choices[0].message.content
+
+async def acall_llm(prompt: str, use_cache: bool = True, model: str=LLMProvider_enum.GOOGLE) -> str:
+    """Async version of call_llm(), sharing its cache; lets many prompts run concurrently."""
+    logger.debug("Calling LLM (async) with model: %s", model)
+    
+    # Log the prompt
+    logger.info("PROMPT: %s", prompt)
+    
+    # Check cache if enabled
+    model_name = _model_name(model)
+    cache_key = _cache_key(prompt, model_name)
+    use_cache = use_cache and cache_enabled
+    if use_cache:
+        cached = _get_from_cache(cache_key)
+        if cached is not None:
+            logger.info("RESPONSE: %s", cached)
+            return cached
+
+    # Call the LLM if not in cache or cache disabled
+    if(model==LLMProvider_enum.GOOGLE):
+        response_text = await _acall_gemini(_get_async_gemini_client(), prompt, model_name)
+    elif(model==LLMProvider_enum.ANTHROPIC):
+        response_text = await _acall_anthropic(_get_async_anthropic_client(), prompt, model_name)
+    else: # Assume OpenAI
+        response_text = await _acall_openai(_get_async_openai_client(), prompt, model_name)
+
+    # Log the response
+    logger.info("RESPONSE: %s", response_text)
+    
+    # Update cache if enabled; the append + fsync runs off the event loop
+    if use_cache:
+        await asyncio.to_thread(_save_to_cache, cache_key, response_text)
     
     return response_text
 
+async def _astream_gemini(client, prompt: str, model_name: str) -> AsyncIterator[str]:
+    async for chunk in await client.models.generate_content_stream(
+        model=model_name,
+        contents=[prompt]
+    ):
+        if chunk.text:
+            yield chunk.text
+
+async def _astream_anthropic(client, prompt: str, model_name: str) -> AsyncIterator[str]:
+    # text_stream only yields the answer text, not the thinking blocks
+    async with client.messages.stream(**_anthropic_params(prompt, model_name)) as stream:
+        async for text in stream.text_stream:
+            yield text
+
+async def _astream_openai(client, prompt: str, model_name: str) -> AsyncIterator[str]:
+    stream = await client.chat.completions.create(**_openai_params(prompt, model_name), stream=True)
+    async with stream:
+        async for chunk in stream:
+            if chunk.choices and chunk.choices[0].delta.content:
+                yield chunk.choices[0].delta.content
+
+async def acall_llm_stream(prompt: str, use_cache: bool = True, model: str=LLMProvider_enum.GOOGLE,
+                           max_chars: Optional[int] = None) -> AsyncIterator[str]:
+    """
+    Async version of call_llm_stream(); close it with aclose() when stopping early.
+    
+    Args:
+        prompt (str): Prompt to send
+        use_cache (bool): Whether to read from and write to the response cache
+        model: LLM provider to use
+        max_chars (int, optional): Stop reading once more than this many characters arrived
+        
+    Yields:
+        str: Chunks of the response text (a cache hit is yielded as one chunk)
+    """
+    logger.debug("Calling LLM (async stream) with model: %s", model)
+    logger.info("PROMPT: %s", prompt)
+    
+    model_name = _model_name(model)
+    cache_key, partial_key = _stream_cache_keys(prompt, model_name, max_chars)
+    use_cache = use_cache and cache_enabled
+    if use_cache:
+        cached = _get_stream_from_cache(cache_key, partial_key)
+        if cached is not None:
+            logger.info("RESPONSE: %s", cached)
+            yield cached
+            return
+    
+    if(model==LLMProvider_enum.GOOGLE):
+        chunks = _astream_gemini(_get_async_gemini_client(), prompt, model_name)
+    elif(model==LLMProvider_enum.ANTHROPIC):
+        chunks = _astream_anthropic(_get_async_anthropic_client(), prompt, model_name)
+    else: # Assume OpenAI
+        chunks = _astream_openai(_get_async_openai_client(), prompt, model_name)
+    
+    parts = []
+    length = 0
+    complete = True
+    async with aclosing(chunks):
+        async for chunk in chunks:
+            parts.append(chunk)
+            length += len(chunk)
+            yield chunk
+            if max_chars is not None and length > max_chars:
+                complete = False
+                break
+    
+    # Not reached if the caller closes the generator early; nothing is cached then
+    response_text = "".join(parts)
+    logger.info("RESPONSE: %s", response_text)
+    if use_cache:
+        await asyncio.to_thread(_save_to_cache, cache_key if complete else partial_key, response_text)
+
+def _openai_batch(prompts: dict, model_name: str, poll_interval: float) -> dict:
+    """Run {custom_id: prompt} through the OpenAI Batch API; return {custom_id: text}."""
+    client = _get_openai_client()
+    lines = [
+        json.dumps({
+            "custom_id": custom_id,
+            "method": "POST",
+            "url": "/v1/chat/completions",
+            "body": _openai_params(prompt, model_name)
+        })
+        for custom_id, prompt in prompts.items()
+    ]
+    batch_file = client.files.create(
+        file=("batch.jsonl", "\n".join(lines).encode("utf-8")),
+        purpose="batch"
+    )
+    batch = client.batches.create(
+        input_file_id=batch_file.id,
+        endpoint="/v1/chat/completions",
+        completion_window="24h"
+    )
+    while batch.status not in ("completed", "failed", "expired", "cancelled"):
+        time.sleep(poll_interval)
+        batch = client.batches.retrieve(batch.id)
+    
+    results = {}
+    if batch.output_file_id:
+        for line in client.files.content(batch.output_file_id).text.splitlines():
+            entry = json.loads(line)
+            response = entry.get("response") or {}
+            if response.get("status_code") == 200:
+                results[entry["custom_id"]] = response["body"]["choices"][0]["message"]["content"]
+    if batch.status != "completed":
+        logger.error(f"OpenAI batch {batch.id} ended with status {batch.status}")
+    return results
+
+def _anthropic_batch(prompts: dict, model_name: str, poll_interval: float) -> dict:
+    """Run {custom_id: prompt} through the Anthropic Message Batches API; return {custom_id: text}."""
+    client = _get_anthropic_client()
+    batch = client.messages.batches.create(requests=[
+        {"custom_id": custom_id, "params": _anthropic_params(prompt, model_name)}
+        for custom_id, prompt in prompts.items()
+    ])
+    while batch.processing_status != "ended":
+        time.sleep(poll_interval)
+        batch = client.messages.batches.retrieve(batch.id)
+    
+    results = {}
+    for entry in client.messages.batches.results(batch.id):
+        if entry.result.type == "succeeded":
+            results[entry.custom_id] = entry.result.message.content[1].text
+        else:
+            logger.error(f"Anthropic batch request {entry.custom_id} {entry.result.type}")
+    return results
+
+def call_llm_batch(prompts: list, use_cache: bool = True, model: str=LLMProvider_enum.OPENAI,
+                   poll_interval: float = 30.0) -> list:
+    """
+    Send many prompts through the provider's asynchronous Batch API (cheaper, higher throughput,
+    but results can take minutes to hours). Cached prompts are answered without being submitted.
+    
+    Args:
+        prompts (list): Prompts to send
+        use_cache (bool): Read from and write to the same cache as call_llm()
+        model: LLMProvider_enum.OPENAI or LLMProvider_enum.ANTHROPIC; Gemini falls back to call_llm()
+        poll_interval (float): Seconds between batch status checks
+        
+    Returns:
+        list: Responses in the same order as prompts; None for requests that failed
+    """
+    if model == LLMProvider_enum.GOOGLE:
+        # No batch endpoint wired up for Gemini, so call it per prompt
+        return [call_llm(prompt, use_cache=use_cache, model=model) for prompt in prompts]
+    
+    model_name = _model_name(model)
+    keys = [_cache_key(prompt, model_name) for prompt in prompts]
+    use_cache = use_cache and cache_enabled
+    
+    responses = [_get_from_cache(key) if use_cache else None for key in keys]
+    pending = {str(i): prompt for i, prompt in enumerate(prompts) if responses[i] is None}
+    if not pending:
+        return responses
+    
+    logger.info(f"Submitting {len(pending)} prompts to the {model_name} batch API")
+    if model == LLMProvider_enum.ANTHROPIC:
+        results = _anthropic_batch(pending, model_name, poll_interval)
+    else: # Assume OpenAI
+        results = _openai_batch(pending, model_name, poll_interval)
+    
+    for custom_id, response_text in results.items():
+        i = int(custom_id)
+        responses[i] = response_text
+        logger.info("RESPONSE: %s", response_text)
+        if use_cache:
+            _save_to_cache(keys[i], response_text)
+    
+    return responses
+
 if __name__ == "__main__":
     test_prompt = "Hello, how are you? What is the exact model are you using?"
     test_prompt2 = "Hello, how bug is your model that are you using?"
@@ -148,3 +675,10 @@ if __name__ == "__main__":
     response1 = call_llm(test_prompt, use_cache=True, model=LLMProvider_enum.GOOGLE)
     print(f"Response: {response1}")
     
+
+    # Streamed call cut short at max_chars - the same call again must be a cache hit
+    print("Making streamed call 3...")
+    streamed = "".join(call_llm_stream(test_prompt2, model=LLMProvider_enum.GOOGLE, max_chars=200))
+    cached = _get_stream_from_cache(*_stream_cache_keys(test_prompt2, _model_name(LLMProvider_enum.GOOGLE), 200))
+    assert cached == streamed, "repeated streamed call should be served from the cache"
+    print(f"Response: {streamed}")
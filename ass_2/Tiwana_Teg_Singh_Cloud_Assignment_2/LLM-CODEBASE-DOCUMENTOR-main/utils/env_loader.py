@@ -1,12 +1,17 @@
 import os
+import types
 import dotenv
 import logging
-from typing import Dict, Any, Optional
+import functools
+from typing import Dict, Any, Mapping, Optional
 
 def load_env_vars(env_file_path: str = ".env") -> Dict[str, str]:
     """
     Load environment variables from .env file.
     
+    Each file is parsed at most once per process; later calls with the same
+    (absolute) path return the values from the first load.
+    
     Args:
         env_file_path (str): Path to the .env file
         
@@ -18,55 +23,60 @@ def load_env_vars(env_file_path: str = ".env") -> Dict[str, str]:
         logging.warning(f".env file not found at {env_file_path}")
         return {}
     
-    # Load the .env file
-    dotenv.load_dotenv(env_file_path)
-    
-    # Return a dictionary of the loaded variables
-    env_vars = {}
+    # Copy so callers can't modify the cached result
+    return dict(_load_env_file(os.path.abspath(env_file_path)))
+
+@functools.lru_cache(maxsize=8)
+def _load_env_file(env_file_path: str) -> Dict[str, str]:
+    """Parse env_file_path and set its variables in os.environ (cached per absolute path)."""
+    # Parse the file once; dotenv handles quoting, `export` prefixes and multi-line values
     try:
-        with open(env_file_path, 'r') as f:
-            for line in f:
-                line = line.strip()
-                if not line or line.startswith('#'):
-                    continue
-                    
-                try:
-                    key, value = line.split('=', 1)
-                    env_vars[key.strip()] = value.strip().strip('"\'')
-                except ValueError:
-                    # Skip lines that don't have key=value format
-                    continue
+        env_vars = {key: value for key, value in dotenv.dotenv_values(env_file_path).items()
+                    if value is not None}
     except Exception as e:
         logging.error(f"Error reading .env file: {e}")
+        return {}
+    
+    # Same as dotenv.load_dotenv(override=False), without parsing the file a second time
+    for key, value in env_vars.items():
+        os.environ.setdefault(key, value)
     
     return env_vars
 
-def get_api_keys() -> Dict[str, Optional[str]]:
+@functools.lru_cache(maxsize=1)
+def get_api_keys() -> Mapping[str, Optional[str]]:
     """
     Get API keys from environment variables.
     
+    The result is computed once per process; call get_api_keys.cache_clear()
+    after changing the variables at runtime.
+    
     Returns:
-        Dict[str, Optional[str]]: Dictionary of API keys
+        Mapping[str, Optional[str]]: Read-only mapping of API keys
     """
-    return {
+    return types.MappingProxyType({
         "github_token": os.environ.get("GITHUB_TOKEN"),
         "openai_api_key": os.environ.get("OPENAI_API_KEY"),
         "anthropic_api_key": os.environ.get("ANTHROPIC_API_KEY"),
         "gemini_api_key": os.environ.get("GEMINI_API_KEY")
-    }
+    })
 
-def get_model_names() -> Dict[str, str]:
+@functools.lru_cache(maxsize=1)
+def get_model_names() -> Mapping[str, str]:
     """
     Get model names from environment variables.
     
+    The result is computed once per process; call get_model_names.cache_clear()
+    after changing the variables at runtime.
+    
     Returns:
-        Dict[str, str]: Dictionary of model names
+        Mapping[str, str]: Read-only mapping of model names
     """
-    return {
+    return types.MappingProxyType({
         "openai_model": os.environ.get("OPENAI_MODEL", "gpt-4o-mini"),
         "anthropic_model": os.environ.get("ANTHROPIC_MODEL", "claude-3-7-sonnet-latest"),
         "gemini_model": os.environ.get("GEMINI_MODEL", "gemini-2.5-pro-exp-03-25")
-    }
+    })
 
 def create_env_example() -> None:
     """
@@ -87,9 +97,9 @@ ANTHROPIC_MODEL=claude-3-7-sonnet-latest
     try:
         with open(".env.example", 'w') as f:
             f.write(example_content)
-        print("Created .env.example file")
+        logging.info("Created .env.example file")
     except Exception as e:
-        print(f"Error creating .env.example file: {e}")
+        logging.error(f"Error creating .env.example file: {e}")
 
 if __name__ == "__main__":
     # Test the environment loading
@@ -1,23 +1,70 @@
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import httpx
+import asyncio
+import importlib.util
 import os
+import time
+from email.utils import parsedate_to_datetime
+from dataclasses import dataclass
 from datetime import datetime
 from typing import List, Dict, Any, Optional
+from utils.async_helpers import run_sync
 
+# Shared session so repeated GitHub API calls reuse keep-alive connections,
+# with retries and backoff for rate limiting and transient server errors
+_SESSION = requests.Session()
+_SESSION.mount('https://', HTTPAdapter(
+    pool_connections=16,
+    pool_maxsize=16,
+    max_retries=Retry(
+        total=3,
+        backoff_factor=0.5,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=["GET"],
+        respect_retry_after_header=True,
+        raise_on_status=False
+    )
+))
+
+@dataclass(slots=True)
 class RepoMetadata:
     """Class to store GitHub repository metadata."""
     
-    def __init__(self, data: Dict[str, Any]):
-        self.name = data.get('name', '')
-        self.full_name = data.get('full_name', '')
-        self.description = data.get('description', 'No description available')
-        self.url = data.get('html_url', '')
-        self.api_url = data.get('url', '')
-        self.stars = data.get('stargazers_count', 0)
-        self.forks = data.get('forks_count', 0)
-        self.issues = data.get('open_issues_count', 0)
-        self.language = data.get('language', 'Unknown')
-        self.updated_at = data.get('updated_at', '')
-        self.readme_summary = None  # To be filled in later
+    name: str = ''
+    full_name: str = ''
+    description: Optional[str] = 'No description available'
+    url: str = ''
+    api_url: str = ''
+    stars: int = 0
+    forks: int = 0
+    issues: int = 0
+    language: Optional[str] = 'Unknown'
+    updated_at: str = ''
+    readme_summary: Optional[str] = None  # To be filled in later
+    
+    @classmethod
+    def from_api(cls, data: Dict[str, Any]) -> "RepoMetadata":
+        """Build from one item of a GitHub API repository response."""
+        return cls(
+            name=data.get('name', ''),
+            full_name=data.get('full_name', ''),
+            description=data.get('description', 'No description available'),
+            url=data.get('html_url', ''),
+            api_url=data.get('url', ''),
+            stars=data.get('stargazers_count', 0),
+            forks=data.get('forks_count', 0),
+            issues=data.get('open_issues_count', 0),
+            language=data.get('language', 'Unknown'),
+            updated_at=data.get('updated_at', '')
+        )
+    
+    @classmethod
+    def from_items(cls, items: List[Dict[str, Any]]) -> List["RepoMetadata"]:
+        """Build one RepoMetadata per item of a GitHub API search response."""
+        from_api = cls.from_api
+        return [from_api(item) for item in items]
 
     def __str__(self):
         return f"{self.full_name} ({self.stars}⭐, {self.language})"
@@ -77,11 +124,11 @@ def github_search_repos(
     url = 'https://api.github.com/search/repositories'
     
     try:
-        response = requests.get(url, headers=headers, params=params)
+        response = _SESSION.get(url, headers=headers, params=params)
         response.raise_for_status()
         
         data = response.json()
-        repos = [RepoMetadata(item) for item in data.get('items', [])]
+        repos = RepoMetadata.from_items(data.get('items', []))
         
         return repos
     except requests.RequestException as e:
@@ -111,13 +158,128 @@ def get_readme_content(repo_full_name: str, token: Optional[str] = None) -> str:
     url = f'https://api.github.com/repos/{repo_full_name}/readme'
     
     try:
-        response = requests.get(url, headers=headers)
+        response = _SESSION.get(url, headers=headers)
         response.raise_for_status()
         
         return response.text
     except requests.RequestException as e:
         return f"Error fetching README: {e}"
 
+def _parse_retry_after(value: str) -> Optional[float]:
+    """Seconds from a Retry-After header (delay-seconds or HTTP-date), or None if unparseable."""
+    try:
+        return float(value)
+    except ValueError:
+        pass
+    try:
+        return max(parsedate_to_datetime(value).timestamp() - time.time(), 0)
+    except (TypeError, ValueError):
+        return None
+
+def _rate_limit_wait(response: httpx.Response, max_wait: float = 60.0) -> Optional[float]:
+    """
+    Seconds to wait before retrying a rate-limited response, or None if it shouldn't be retried.
+    
+    Uses Retry-After (secondary rate limit) or X-RateLimit-Reset when no requests remain;
+    waits longer than max_wait are not worth blocking a search on.
+    """
+    if response.status_code not in (403, 429):
+        return None
+    
+    if response.headers.get('Retry-After'):
+        wait = _parse_retry_after(response.headers['Retry-After'])
+    elif response.headers.get('X-RateLimit-Remaining') == '0':
+        try:
+            wait = max(float(response.headers.get('X-RateLimit-Reset', 0)) - time.time(), 0) + 1
+        except ValueError:
+            wait = None
+    else:
+        return None
+    
+    return wait if wait is not None and wait <= max_wait else None
+
+async def aget_readme_content(
+    repo_full_name: str, 
+    client: httpx.AsyncClient, 
+    token: Optional[str] = None,
+    max_attempts: int = 3
+) -> str:
+    """
+    Async version of get_readme_content() using a shared httpx.AsyncClient.
+    
+    Args:
+        repo_full_name: Full name of the repository (owner/repo)
+        client: Async HTTP client to send the request with
+        token: GitHub API token for authenticated requests
+        max_attempts: Attempts before giving up on a rate-limited request
+    
+    Returns:
+        README content as string or error message
+    """
+    # Default headers
+    headers = {
+        'Accept': 'application/vnd.github.v3.raw'
+    }
+    
+    # Add authorization if token provided
+    if token:
+        headers['Authorization'] = f'token {token}'
+    
+    url = f'https://api.github.com/repos/{repo_full_name}/readme'
+    
+    for attempt in range(max_attempts):
+        try:
+            response = await client.get(url, headers=headers)
+        except httpx.HTTPError as e:
+            return f"Error fetching README: {e}"
+        
+        # Back off and retry when GitHub rate limits us
+        wait = _rate_limit_wait(response)
+        if wait is not None and attempt < max_attempts - 1:
+            await asyncio.sleep(wait)
+            continue
+        
+        try:
+            response.raise_for_status()
+        except httpx.HTTPStatusError as e:
+            return f"Error fetching README: {e}"
+        return response.text
+
+async def get_readmes_bulk(
+    repo_full_names: List[str], 
+    token: Optional[str] = None, 
+    max_concurrency: int = 8
+) -> List[str]:
+    """
+    Fetch READMEs for many repositories concurrently.
+    
+    Args:
+        repo_full_names: Full names of the repositories (owner/repo)
+        token: GitHub API token for authenticated requests
+        max_concurrency: Maximum number of requests in flight at once
+    
+    Returns:
+        README contents (or error messages) in the same order as repo_full_names
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+    # HTTP/2 lets the requests share one connection, but needs the optional h2 package
+    http2 = importlib.util.find_spec("h2") is not None
+    
+    async with httpx.AsyncClient(http2=http2, timeout=10) as client:
+        async def fetch_one(repo_full_name):
+            async with semaphore:
+                return await aget_readme_content(repo_full_name, client, token)
+        
+        return await asyncio.gather(*(fetch_one(name) for name in repo_full_names))
+
+def get_readmes_bulk_sync(
+    repo_full_names: List[str], 
+    token: Optional[str] = None, 
+    max_concurrency: int = 8
+) -> List[str]:
+    """Blocking wrapper around get_readmes_bulk() for synchronous callers."""
+    return run_sync(get_readmes_bulk(repo_full_names, token, max_concurrency))
+
 if __name__ == "__main__":
     # Test the GitHub API functions
     token = os.environ.get('GITHUB_TOKEN')
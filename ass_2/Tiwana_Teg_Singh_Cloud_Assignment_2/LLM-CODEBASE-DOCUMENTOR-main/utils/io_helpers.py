@@ -1,10 +1,29 @@
 import os
 import zipfile
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 import shutil
+import logging
 import datetime
 
+# Kept importable from here for backwards compatibility; env_loader has the implementation
+from utils.env_loader import load_env_vars
+
+# Read/write buffer used when copying files into the archive
+ZIP_COPY_BUFSIZE = 1024 * 1024
+
+def _iter_files(root: str):
+    """Yield a DirEntry for every regular file under root, without following symlinked directories."""
+    stack = [root]
+    while stack:
+        with os.scandir(stack.pop()) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.is_file():
+                    yield entry
+
 def zip_output_folder(folder_path: str, output_zip_path: Optional[str] = None) -> str:
     """
     Create a ZIP archive of the output folder.
@@ -29,41 +48,21 @@ def zip_output_folder(folder_path: str, output_zip_path: Optional[str] = None) -
             f"{folder_name}_{timestamp}.zip"
         )
     
-    with zipfile.ZipFile(output_zip_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
-        # Walk through all files in the directory
-        for root, _, files in os.walk(folder_path):
-            for file in files:
-                file_path = os.path.join(root, file)
-                # Calculate path relative to the folder root for the archive
-                arcname = os.path.relpath(file_path, folder_path)
-                zipf.write(file_path, arcname)
+    # First pass: collect (file path, path relative to the folder root for the archive)
+    files = [
+        (entry.path, os.path.relpath(entry.path, folder_path))
+        for entry in _iter_files(folder_path)
+    ]
     
-    return output_zip_path
-
-def load_env_vars(env_file_path: str) -> None:
-    """
-    Load environment variables from .env file if dotenv module is available.
-    Fallback to manual loading if not.
+    with zipfile.ZipFile(output_zip_path, 'w', zipfile.ZIP_DEFLATED, allowZip64=True) as zipf:
+        for file_path, arcname in files:
+            zinfo = zipfile.ZipInfo.from_file(file_path, arcname)
+            zinfo.compress_type = zipfile.ZIP_DEFLATED
+            with open(file_path, 'rb', buffering=ZIP_COPY_BUFSIZE) as src, \
+                    zipf.open(zinfo, 'w') as dest:
+                shutil.copyfileobj(src, dest, ZIP_COPY_BUFSIZE)
     
-    Args:
-        env_file_path (str): Path to the .env file
-    """
-    try:
-        from dotenv import load_dotenv
-        load_dotenv(env_file_path)
-    except ImportError:
-        print("python-dotenv not found, using manual .env loading")
-        # Manual loading of .env as fallback
-        try:
-            with open(env_file_path, 'r') as f:
-                for line in f:
-                    line = line.strip()
-                    if not line or line.startswith('#'):
-                        continue
-                    key, value = line.split('=', 1)
-                    os.environ[key.strip()] = value.strip().strip('"\'')
-        except Exception as e:
-            print(f"Error loading .env file: {e}")
+    return output_zip_path
 
 def read_markdown_file(file_path: str) -> str:
     """
@@ -93,12 +92,16 @@ def read_all_markdown_files(directory: str) -> dict:
     """
     result = {}
     try:
-        for filename in os.listdir(directory):
-            if filename.endswith('.md'):
-                file_path = os.path.join(directory, filename)
-                result[filename] = read_markdown_file(file_path)
+        with os.scandir(directory) as it:
+            entries = [entry for entry in it if entry.name.endswith('.md') and entry.is_file()]
+        if entries:
+            # Reads are I/O bound, so threads overlap the open()/read() latency
+            with ThreadPoolExecutor(max_workers=min(32, len(entries))) as executor:
+                contents = executor.map(read_markdown_file, [entry.path for entry in entries])
+                for entry, content in zip(entries, contents):
+                    result[entry.name] = content
     except Exception as e:
-        print(f"Error reading directory: {e}")
+        logging.error(f"Error reading directory: {e}")
     
     return result
 
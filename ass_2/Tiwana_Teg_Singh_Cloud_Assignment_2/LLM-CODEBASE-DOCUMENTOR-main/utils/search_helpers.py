@@ -1,4 +1,13 @@
-from utils.call_llm import call_llm, LLMProvider_enum
+from utils.call_llm import call_llm, acall_llm, LLMProvider_enum
+from utils.async_helpers import gather_bounded, run_sync
+import json
+import re
+
+# http(s) URL whose host part contains github.com; match() only scans the prefix
+_GITHUB_URL_RE = re.compile(r'https?://[^/\s]*github\.com', re.IGNORECASE)
+
+# Common words dropped when falling back to keywords taken from the query itself
+_STOPWORDS = frozenset({'the', 'and', 'for', 'that', 'with', 'this', 'what', 'how'})
 
 def extract_keywords(query_input: str, llm_provider=None) -> list:
     """
@@ -49,7 +58,70 @@ def extract_keywords(query_input: str, llm_provider=None) -> list:
 
     # Natural language query: "{query_input}"""
 
-    prompt = f"""
+    prompt = _keywords_prompt(query_input)
+
+    try:
+        # Use the specified provider if available, otherwise use default
+        response = call_llm(prompt, model=llm_provider if llm_provider else LLMProvider_enum.GOOGLE)
+        return _parse_keywords(response, query_input)
+    except Exception as e:
+        print(f"Error extracting keywords: {e}")
+        # Fallback to simple keyword extraction on failure
+        return query_input.split()
+
+async def aextract_keywords(query_input: str, llm_provider=None) -> list:
+    """
+    Async version of extract_keywords().
+    
+    Args:
+        query_input (str): Natural language query string
+        llm_provider: LLM provider to use (default: None, which uses the default provider)
+        
+    Returns:
+        list: List of extracted keywords for GitHub search
+    """
+    prompt = _keywords_prompt(query_input)
+
+    try:
+        response = await acall_llm(prompt, model=llm_provider if llm_provider else LLMProvider_enum.GOOGLE)
+        return _parse_keywords(response, query_input)
+    except Exception as e:
+        print(f"Error extracting keywords: {e}")
+        return query_input.split()
+
+def extract_keywords_bulk(
+    queries: list,
+    llm_provider=None,
+    max_concurrency: int = 8,
+    rate_limit_per_min: int = 100,
+    on_progress=None
+) -> list:
+    """
+    Extract keywords for many queries concurrently.
+    
+    Args:
+        queries (list): Natural language query strings
+        llm_provider: LLM provider to use (default: None, which uses the default provider)
+        max_concurrency (int): Maximum number of LLM calls in flight at once
+        rate_limit_per_min (int): Maximum number of LLM calls started per minute
+        on_progress (callable, optional): Called as on_progress(completed, total)
+        
+    Returns:
+        list: One keyword list per query, in the same order as queries
+    """
+    async def extract_one(query_input):
+        return await aextract_keywords(query_input, llm_provider)
+    
+    return run_sync(gather_bounded(
+        queries, extract_one,
+        max_concurrency=max_concurrency,
+        rate_limit_per_min=rate_limit_per_min,
+        on_progress=on_progress
+    ))
+
+def _keywords_prompt(query_input: str) -> str:
+    """Build the keyword extraction prompt."""
+    return f"""
     Rewrite my request from a natural language query into a simple 3-4 word query to find only relevant GitHub repositories to my natural text.
     Return just a JSON array of strings, with no explanation.
     
@@ -59,27 +131,28 @@ def extract_keywords(query_input: str, llm_provider=None) -> list:
     ["keyword1", "keyword2", "keyword3"]
     """
 
+def _parse_keywords(response: str, query_input: str) -> list:
+    """Parse the LLM keyword response, falling back to words from the query."""
+    # Parse the outermost [...] in the response as a JSON array
     try:
-        # Use the specified provider if available, otherwise use default
-        response = call_llm(prompt, model=llm_provider if llm_provider else LLMProvider_enum.GOOGLE)
-        # Simple parsing to extract array content
-        if response.strip().startswith('[') and response.strip().endswith(']'):
-            # Extract items between brackets and split by commas
-            keywords_str = response.strip()[1:-1]
-            # Split by commas and clean up each keyword
-            keywords = [k.strip().strip('"\'') for k in keywords_str.split(',')]
-            return keywords
-        else:
-            # Fallback: split the query into words, filter out common words
-            simple_keywords = [word for word in query_input.split() 
-                              if len(word) > 3 and word.lower() not in {
-                                  'the', 'and', 'for', 'that', 'with', 'this', 'what', 'how'
-                              }]
-            return simple_keywords
-    except Exception as e:
-        print(f"Error extracting keywords: {e}")
-        # Fallback to simple keyword extraction on failure
-        return query_input.split()
+        keywords = json.loads(response[response.index('['):response.rindex(']') + 1])
+        if isinstance(keywords, list):
+            return [str(k).strip() for k in keywords if isinstance(k, (str, int))]
+    except ValueError:
+        pass
+    
+    # Simple parsing to extract array content (e.g. single-quoted items)
+    if response.strip().startswith('[') and response.strip().endswith(']'):
+        # Extract items between brackets and split by commas
+        keywords_str = response.strip()[1:-1]
+        # Split by commas and clean up each keyword
+        keywords = [k.strip().strip('"\'') for k in keywords_str.split(',')]
+        return keywords
+    else:
+        # Fallback: split the query into words, filter out common words
+        simple_keywords = [word for word in query_input.split() 
+                          if len(word) > 3 and word.lower() not in _STOPWORDS]
+        return simple_keywords
 
 def looks_like_url(text: str) -> bool:
     """
@@ -91,4 +164,4 @@ def looks_like_url(text: str) -> bool:
     Returns:
         bool: True if text appears to be a URL
     """
-    return text.startswith(('http://', 'https://')) and 'github.com' in text.lower() 
\ No newline at end of file
+    return _GITHUB_URL_RE.match(text) is not None
\ No newline at end of file
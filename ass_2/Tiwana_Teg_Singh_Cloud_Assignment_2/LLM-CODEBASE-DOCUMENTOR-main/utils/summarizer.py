@@ -1,6 +1,26 @@
-from utils.call_llm import call_llm, LLMProvider_enum
+from utils.call_llm import acall_llm_stream, call_llm_batch, call_llm_stream, LLMProvider_enum
+from utils.async_helpers import gather_bounded, run_sync
 import re
 
+# Markdown cleanup patterns for extract_first_paragraph(), compiled once
+_MD_HEADER = re.compile(r'#+ ')
+_MD_LINK = re.compile(r'\[([^\]]+)\]\([^)]+\)')
+_MD_IMAGE = re.compile(r'!\[([^\]]*)\]\([^)]+\)')
+_PARA_SPLIT = re.compile(r'\n\s*\n')
+
+def _summary_prompt(truncated_text: str) -> str:
+    """Build the README summary prompt."""
+    return f"""
+    Provide a clear, concise summary of the following repository README.
+    Focus on what the repository does, key features, and its purpose.
+    Keep your response to about 2-3 sentences, under 100 words.
+    
+    README CONTENT:
+    {truncated_text}
+    
+    YOUR SUMMARY:
+    """
+
 def summarize_readme(readme_text: str, max_length: int = 500, llm_provider=None) -> str:
     """
     Generate a concise summary of a repository README using LLM.
@@ -16,29 +36,123 @@ def summarize_readme(readme_text: str, max_length: int = 500, llm_provider=None)
     # Limit input length to prevent context overflow
     truncated_text = truncate_text(readme_text, 6000)  # Limit to ~6k chars
     
-    prompt = f"""
-    Provide a clear, concise summary of the following repository README.
-    Focus on what the repository does, key features, and its purpose.
-    Keep your response to about 2-3 sentences, under 100 words.
+    prompt = _summary_prompt(truncated_text)
     
-    README CONTENT:
-    {truncated_text}
+    try:
+        # Use the specified provider if available, otherwise use default.
+        # The stream stops (and is cached) once there is enough text to fill max_length
+        summary = "".join(call_llm_stream(
+            prompt,
+            model=llm_provider if llm_provider else LLMProvider_enum.GOOGLE,
+            max_chars=max_length
+        ))
+        # Ensure the summary doesn't exceed max_length
+        if len(summary) > max_length:
+            summary = summary[:max_length-3] + "..."
+        return summary
+    except Exception as e:
+        print(f"Error summarizing README: {e}")
+        # Fallback to manual extraction
+        return extract_first_paragraph(truncated_text, max_length)
+
+async def asummarize_readme(readme_text: str, max_length: int = 500, llm_provider=None) -> str:
+    """
+    Async version of summarize_readme(), so several READMEs can be summarized concurrently.
     
-    YOUR SUMMARY:
+    Args:
+        readme_text (str): README content as text
+        max_length (int): Maximum length of the summary in characters
+        llm_provider: LLM provider to use (default: None, which uses the default provider)
+        
+    Returns:
+        str: Concise summary of the README
     """
+    truncated_text = truncate_text(readme_text, 6000)  # Limit to ~6k chars
+    
+    prompt = _summary_prompt(truncated_text)
     
     try:
-        # Use the specified provider if available, otherwise use default
-        summary = call_llm(prompt, model=llm_provider if llm_provider else LLMProvider_enum.GOOGLE)
-        # Ensure the summary doesn't exceed max_length
+        # The stream stops (and is cached) once there is enough text to fill max_length
+        summary = "".join([chunk async for chunk in acall_llm_stream(
+            prompt,
+            model=llm_provider if llm_provider else LLMProvider_enum.GOOGLE,
+            max_chars=max_length
+        )])
         if len(summary) > max_length:
             summary = summary[:max_length-3] + "..."
         return summary
     except Exception as e:
         print(f"Error summarizing README: {e}")
-        # Fallback to manual extraction
         return extract_first_paragraph(truncated_text, max_length)
 
+def summarize_readmes_bulk(
+    readmes: list,
+    max_length: int = 500,
+    llm_provider=None,
+    max_concurrency: int = 8,
+    rate_limit_per_min: int = 100,
+    on_progress=None
+) -> list:
+    """
+    Summarize many READMEs concurrently instead of one LLM round-trip at a time.
+    
+    Args:
+        readmes (list): README contents as text
+        max_length (int): Maximum length of each summary in characters
+        llm_provider: LLM provider to use (default: None, which uses the default provider)
+        max_concurrency (int): Maximum number of LLM calls in flight at once
+        rate_limit_per_min (int): Maximum number of LLM calls started per minute
+        on_progress (callable, optional): Called as on_progress(completed, total)
+        
+    Returns:
+        list: Summaries in the same order as readmes
+    """
+    async def summarize_one(readme_text):
+        return await asummarize_readme(readme_text, max_length, llm_provider)
+    
+    return run_sync(gather_bounded(
+        readmes, summarize_one,
+        max_concurrency=max_concurrency,
+        rate_limit_per_min=rate_limit_per_min,
+        on_progress=on_progress
+    ))
+
+def summarize_readmes_batch_api(
+    readmes: list,
+    llm_provider=LLMProvider_enum.OPENAI,
+    max_length: int = 500,
+    poll_interval: float = 30.0
+) -> list:
+    """
+    Summarize many READMEs through the provider's Batch API, for offline bulk runs
+    where cost matters more than latency.
+    
+    Args:
+        readmes (list): README contents as text
+        llm_provider: LLMProvider_enum.OPENAI or LLMProvider_enum.ANTHROPIC
+        max_length (int): Maximum length of each summary in characters
+        poll_interval (float): Seconds between batch status checks
+        
+    Returns:
+        list: Summaries in the same order as readmes
+    """
+    truncated_texts = [truncate_text(readme_text, 6000) for readme_text in readmes]
+    responses = call_llm_batch(
+        [_summary_prompt(text) for text in truncated_texts],
+        model=llm_provider,
+        poll_interval=poll_interval
+    )
+    
+    summaries = []
+    for text, summary in zip(truncated_texts, responses):
+        if summary is None:
+            # Fallback to manual extraction for failed requests
+            summary = extract_first_paragraph(text, max_length)
+        elif len(summary) > max_length:
+            summary = summary[:max_length-3] + "..."
+        summaries.append(summary)
+    return summaries
+
 def truncate_text(text: str, max_chars: int) -> str:
     """
     Truncate text to maximum character limit while preserving complete sentences.
@@ -53,11 +167,10 @@ def truncate_text(text: str, max_chars: int) -> str:
     if len(text) <= max_chars:
         return text
     
-    # Find the last sentence boundary before max_chars
-    truncated = text[:max_chars]
-    last_period = truncated.rfind('.')
-    last_question = truncated.rfind('?')
-    last_exclamation = truncated.rfind('!')
+    # Find the last sentence boundary before max_chars, searching in place
+    last_period = text.rfind('.', 0, max_chars)
+    last_question = text.rfind('?', 0, max_chars)
+    last_exclamation = text.rfind('!', 0, max_chars)
     
     # Find the last sentence boundary
     last_sentence_end = max(last_period, last_question, last_exclamation)
@@ -66,7 +179,7 @@ def truncate_text(text: str, max_chars: int) -> str:
         return text[:last_sentence_end + 1] + "..."
     else:
         # If no sentence boundary found, just truncate
-        return truncated + "..."
+        return text[:max_chars] + "..."
 
 def extract_first_paragraph(text: str, max_length: int = 500) -> str:
     """
@@ -80,12 +193,14 @@ def extract_first_paragraph(text: str, max_length: int = 500) -> str:
         str: Extracted paragraph
     """
     # Remove Markdown formatting
-    cleaned_text = re.sub(r'#+ ', '', text)
-    cleaned_text = re.sub(r'\[([^\]]+)\]\([^)]+\)', r'\1', cleaned_text)  # Replace links with text
-    cleaned_text = re.sub(r'!\[([^\]]*)\]\([^)]+\)', '', cleaned_text)  # Remove images
+    # Links are unwrapped before images are removed, so that linked images
+    # (e.g. [![badge](img)](url)) collapse to an image and then disappear
+    cleaned_text = _MD_HEADER.sub('', text)
+    cleaned_text = _MD_LINK.sub(r'\1', cleaned_text)  # Replace links with text
+    cleaned_text = _MD_IMAGE.sub('', cleaned_text)  # Remove images
     
     # Split by double newlines (paragraph breaks)
-    paragraphs = re.split(r'\n\s*\n', cleaned_text)
+    paragraphs = _PARA_SPLIT.split(cleaned_text)
     
     # Find first non-empty paragraph
     for paragraph in paragraphs: